@@ -1,13 +1,17 @@
-from datetime import datetime
-import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 import re
-from typing import Any, Dict, Optional, Union
-from urllib.request import Request, urlopen
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
 
 from hurry.filesize import size
+import numpy as np
+import orjson
 import pandas as pd
-import requests
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
+import urllib3
 
 
 st.set_page_config(
@@ -47,38 +51,129 @@ st.image(
 st.markdown(body='# KZFR Show Picker')
 
 
+STUDIO_CREEK_API_URL = 'https://kzfr.studio.creek.org/api/archives'
+REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+PUNCTUATION_PATTERN = re.compile(pattern=r'[^\w\s]')
+
+# the show time format used in static URLs and archive audio file names
+TIME_SELECTED_FORMAT = '%Y-%m-%d_%H-%M-%S'
+# the show time format displayed to users and offered in the archive show date selectbox
+READABLE_TIME_FORMAT = '%m/%d/%Y @ %I:%M %p'
+# offsets to probe around a show time NOT in the archive when no audio exists at that exact time
+NEARBY_SHOW_TIME_OFFSETS = tuple(timedelta(minutes=minutes) for minutes in (-60, -30, 30, 60))
+
+# ugh what a stupid hack
+PHILOSOPHERS_ON_CULTURE_AND_WHATS_THE_FREQUENCY_KENNETH_TIME_SWAP_DICT = {
+    '2023-11-09_17-00-00': '2023-11-16_17-00-00',
+    '2023-10-26_17-00-00': '2023-11-02_17-00-00',
+    '2023-10-12_17-00-00': '2023-10_19-17-00-00',
+    '2023-09-28_17-00-00': '2023-10_05-17-00-00',
+    '2023-09-14_17-00-00': '2023-09_21-17-00-00',
+    '2023-08-31_17-00-00': '2023-09_07-17-00-00',
+    '2023-08-17_17-00-00': '2023-08-24_17-00-00',
+    '2023-08-03_17-00-00': '2023-08-10_17-00-00',
+    '2023-07-20_17-00-00': '2023-07-27_17-00-00',
+}
+TIME_SWAP_DICT = {
+    **PHILOSOPHERS_ON_CULTURE_AND_WHATS_THE_FREQUENCY_KENNETH_TIME_SWAP_DICT,
+    **{
+        v: k
+        for k, v in PHILOSOPHERS_ON_CULTURE_AND_WHATS_THE_FREQUENCY_KENNETH_TIME_SWAP_DICT.items()
+    },
+}
+
+
+@st.cache_resource(show_spinner=False)
+def get_pool_manager() -> urllib3.PoolManager:
+    """Create a single ``urllib3.PoolManager`` with proper headings, shared across sessions."""
+    # ``maxsize`` matches the number of threads fetching archive pages concurrently
+    return urllib3.PoolManager(num_pools=4, maxsize=16, headers=REQUEST_HEADERS)
+
+
 def make_request(url: str) -> Dict[str, Any]:
     """Make a request to a url ``url`` with proper headings, returning the JSON-ified response."""
-    with urlopen(url=Request(url=url, headers={'User-Agent': 'Mozilla/5.0'})) as fp:
-        response_dict = json.load(fp=fp)
+    # archive pages are large, highly compressible JSON, and ``urllib3`` decompresses them for us
+    response = get_pool_manager().request(
+        method='GET',
+        url=url,
+        headers={**REQUEST_HEADERS, 'Accept-Encoding': 'gzip'},
+        timeout=10,
+    )
+
+    if response.status >= 400:
+        raise urllib3.exceptions.HTTPError(
+            f'Request to {url} failed with status {response.status}.'
+        )
+
+    response_dict = orjson.loads(response.data)
 
     return response_dict
 
 
-@st.cache_data(show_spinner=False, ttl=(60 * 15))  # refresh every ``15`` minutes
-def read_studio_creek_website_data() -> pd.DataFrame:
+def get_last_page_number(archives_dict: Dict[str, Any]) -> Optional[int]:
+    """Get the last page number of an archives response, if present."""
+    try:
+        return int(archives_dict['meta']['last_page'])
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    try:
+        return int(parse_qs(qs=urlparse(url=archives_dict['links']['last']).query)['page'][0])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def format_timestamps(timestamps: pd.Series, date_format: str) -> pd.Series:
+    """Format a timezone-aware datetime Series ``timestamps`` as strings in their local time."""
+    # truncate to whole seconds first so ``%S`` is not rendered with a fractional part
+    timestamps_array = pa.array(obj=timestamps).cast(
+        target_type=pa.timestamp(unit='s', tz=str(timestamps.dt.tz)),
+        safe=False,
+    )
+
+    return pd.Series(
+        data=pc.strftime(timestamps_array, format=date_format, locale='C'),
+        index=timestamps.index,
+        dtype='string[pyarrow]',
+    )
+
+
+class ArchiveData(NamedTuple):
+    """The show list and archives parsed out of the Studio Creek APIs, plus lookups into them."""
+
+    show_titles: List[str]
+    show_title_positions: Dict[str, int]
+    archive_records: List[Dict[str, Any]]
+    title_row_positions: Dict[str, np.ndarray]
+    time_options_by_title: Dict[str, List[str]]
+    row_positions: Dict[Tuple[str, str], int]
+    filesize_by_url: Dict[str, int]
+
+
+@st.cache_resource(show_spinner=False, ttl=(60 * 15))  # refresh every ``15`` minutes
+def read_studio_creek_website_data() -> ArchiveData:
     """
     Parse the Studio Creek APIs for both show names and archives.
 
-    This is cached using ``st.cache`` and configured to reset every 15 minutes.
+    This is cached using ``st.cache_resource`` and configured to reset every 15 minutes, so all
+    returned values are shared and must be treated as read-only.
 
     Returns
     -------
+    archive_data: ArchiveData
+        A named tuple with the fields below
+
     show_titles: list
         A list of all shows returned in the ``shows-list`` API endpoint
-    archives_df: pd.DataFrame
-        A DataFrame containing the show archives data, specifically columns:
-
-            * id: str
+    show_title_positions: dict
+        A mapping of each title in ``show_titles`` to its position in that list
+    archive_records: list
+        A list of show archives, one dictionary per archive, sorted by show ``title`` and otherwise
+        kept in API order. Missing values are ``None``. Each dictionary has just the keys the page
+        reads:
 
             * start: datetime
 
-            * end: datetime
-
-            * title: str
-
-            * name: str
-
             * summary: str
 
             * description: str
@@ -89,64 +184,235 @@ def read_studio_creek_website_data() -> pd.DataFrame:
 
             * url: str
 
+    title_row_positions: dict
+        A mapping of each show ``title`` in ``archive_records`` to an array of the positions of all
+        of its archives in that list
+    time_options_by_title: dict
+        A mapping of each show ``title`` in ``archive_records`` to a list of its distinct
+        ``start_readable`` show times, in archive order
+    row_positions: dict
+        A mapping of each ``(title, start_readable)`` and ``(title, start_key)`` pair to the
+        position of its first archive in ``archive_records``
+    filesize_by_url: dict
+        A mapping of each audio ``url`` in ``archive_records`` to its first known ``filesize``
+
     """
     with st.spinner(text='Refreshing our show list with the Studio Creek archives...'):
-        shows_dict = make_request(url='https://kzfr.studio.creek.org/api/archives/shows-list')
-
-        archives_dict_data = list()
-        archives_page = 1
-
-        while True:
-            archives_dict = make_request(
-                url=f'https://kzfr.studio.creek.org/api/archives?page={archives_page}',
-            )
-            archives_dict_data += archives_dict['data']
-
-            if archives_dict['links'].get('next'):
-                archives_page += 1
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            # fetch the show list alongside the first archives page, since we need the latter to
+            # know how many more pages there are to fetch
+            shows_future = executor.submit(make_request, url=f'{STUDIO_CREEK_API_URL}/shows-list')
+            archives_dict = make_request(url=f'{STUDIO_CREEK_API_URL}?page=1')
+            archives_dict_data = list(archives_dict['data'])
+
+            last_page = get_last_page_number(archives_dict=archives_dict)
+
+            if last_page is not None:
+                archives_urls = [
+                    f'{STUDIO_CREEK_API_URL}?page={archives_page}'
+                    for archives_page in range(2, last_page + 1)
+                ]
+
+                for archives_dict in executor.map(make_request, archives_urls):
+                    archives_dict_data += archives_dict['data']
             else:
-                break
-
-        # prep show titles
-        show_titles = sorted(set([x['title'] for x in shows_dict['data']]))
-
-        # prep archives data
-        archives_df = pd.DataFrame(
-            data=[
-                {
-                    'id': item['id'],
-                    'start': item['start'],
-                    'end': item['end'],
-                    'title': item['show']['title'],
-                    'name': item['show']['name'],
-                    'summary': item['show']['summary'],
-                    'description': item['show']['description'],
-                    'image_url': item['image']['url'],
-                    'filesize': item['audio']['filesize'],
-                    'url': item['audio']['url'],
+                # no page count to work off of, so fall back to following the ``next`` links
+                archives_page = 1
+
+                while archives_dict['links'].get('next'):
+                    archives_page += 1
+                    archives_dict = make_request(
+                        url=f'{STUDIO_CREEK_API_URL}?page={archives_page}',
+                    )
+                    archives_dict_data += archives_dict['data']
+
+            shows_dict = shows_future.result()
+
+        # prep show titles, along with each title's position for seeding the show selectbox
+        show_titles = sorted({x['title'] for x in shows_dict['data']})
+        show_title_positions = {title: position for position, title in enumerate(show_titles)}
+
+        # prep archives data, mapping each flattened JSON path to its column name
+        archives_columns = {
+            'id': 'id',
+            'start': 'start',
+            'end': 'end',
+            'show.title': 'title',
+            'show.name': 'name',
+            'show.summary': 'summary',
+            'show.description': 'description',
+            'image.url': 'image_url',
+            'audio.filesize': 'filesize',
+            'audio.url': 'url',
+        }
+        # only the first level of nesting is needed, and ``reindex`` leaves a missing column as
+        # all-missing values (e.g. when no archive on any page has an image) rather than erroring
+        archives_df = (
+            pd.json_normalize(data=archives_dict_data, max_level=1)
+            .reindex(columns=list(archives_columns))
+            .rename(columns=archives_columns)
+            .astype(
+                dtype={
+                    'id': 'string[pyarrow]',
+                    'title': 'category',
+                    'name': 'category',
+                    'summary': 'string[pyarrow]',
+                    'description': 'string[pyarrow]',
+                    'image_url': 'string[pyarrow]',
+                    'filesize': 'Int64',
+                    'url': 'string[pyarrow]',
                 }
-                for item in archives_dict_data
-            ]
+            )
         )
         archives_df['start'] = (
-            pd.to_datetime(arg=archives_df['start'], utc=True).dt.tz_convert(tz='US/Pacific')
+            pd.to_datetime(arg=archives_df['start'], utc=True, format='ISO8601')
+            .dt.tz_convert(tz='US/Pacific')
         )
         archives_df['end'] = (
-            pd.to_datetime(arg=archives_df['end'], utc=True).dt.tz_convert(tz='US/Pacific')
+            pd.to_datetime(arg=archives_df['end'], utc=True, format='ISO8601')
+            .dt.tz_convert(tz='US/Pacific')
+        )
+        archives_df['start_readable'] = format_timestamps(
+            timestamps=archives_df['start'],
+            date_format=READABLE_TIME_FORMAT,
         )
-        archives_df['start_readable'] = (
-            archives_df['start'].dt.strftime(date_format='%m/%d/%Y @ %I:%M %p')
+        archives_df['start_key'] = format_timestamps(
+            timestamps=archives_df['start'],
+            date_format=TIME_SELECTED_FORMAT,
         )
 
-        return show_titles, archives_df
+        # a stable sort keeps each show's archives in the order the API returned them
+        archives_df = archives_df.set_index(keys='title').sort_index(kind='stable')
+
+        # prep the positions of each show's archives, so filtering a show is a lookup, not a scan
+        title_row_positions = archives_df.groupby(level='title', observed=True, sort=False).indices
+
+        # prep the distinct show times offered for each show, so a rerun only needs a lookup
+        time_options_by_title = {
+            title: times.tolist()
+            for title, times in (
+                archives_df.groupby(level='title', observed=True, sort=False)['start_readable']
+                .unique()
+                .items()
+            )
+        }
+
+        # prep the position of the first archive for every show and show time, in either format
+        row_positions = dict()
+
+        for time_column in ['start_key', 'start_readable']:
+            for row_position, show_time in enumerate(
+                zip(archives_df.index, archives_df[time_column])
+            ):
+                row_positions.setdefault(show_time, row_position)
+
+        # prep the first known file size for every audio URL
+        filesizes_df = (
+            archives_df.loc[archives_df['url'].notna() & archives_df['filesize'].notna()]
+            .drop_duplicates(subset='url', keep='first')
+        )
+        filesize_by_url = dict(zip(filesizes_df['url'], filesizes_df['filesize']))
+
+        # prep plain dictionaries for the page to read single archives from, which is much cheaper
+        # than materializing a DataFrame row (and lets missing values be ``None`` over ``pd.NA``)
+        records_df = archives_df[
+            ['start', 'summary', 'description', 'image_url', 'filesize', 'url']
+        ].astype(dtype=object)
+        archive_records = records_df.where(cond=records_df.notna(), other=None).to_dict(
+            orient='records',
+        )
+
+        return ArchiveData(
+            show_titles=show_titles,
+            show_title_positions=show_title_positions,
+            archive_records=archive_records,
+            title_row_positions=title_row_positions,
+            time_options_by_title=time_options_by_title,
+            row_positions=row_positions,
+            filesize_by_url=filesize_by_url,
+        )
+
+
+def probe_url(url: str) -> bool:
+    """Request just the first byte of url ``url``, returning whether it exists or not."""
+    # Backblaze occasionally rejects ``HEAD`` requests, so use a ranged ``GET`` instead
+    response = get_pool_manager().request(
+        method='GET',
+        url=url,
+        headers={**REQUEST_HEADERS, 'Range': 'bytes=0-0'},
+        timeout=3,
+        retries=False,
+        redirect=False,
+        preload_content=False,
+    )
+
+    try:
+        if response.status >= 500:
+            raise urllib3.exceptions.HTTPError(
+                f'Request to {url} failed with status {response.status}.'
+            )
+
+        return response.status in (200, 206)
+    finally:
+        if response.status == 206:
+            # the body is just the one byte, so read it to return the connection to the pool
+            response.drain_conn()
+            response.release_conn()
+        else:
+            response.close()
 
 
+@st.cache_data(show_spinner=False, ttl=(60 * 15))  # refresh every ``15`` minutes
 def check_if_url_exists(url: str) -> bool:
     """Check if a URL exists or not."""
+    # failed requests raise rather than return ``False``, since Streamlit does not cache exceptions
+    return probe_url(url=url)
+
+
+def check_if_urls_exist(urls: List[str]) -> Dict[str, bool]:
+    """Check if each URL in ``urls`` exists or not concurrently, returning a mapping by URL."""
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        futures = {url: executor.submit(check_if_url_exists, url=url) for url in urls}
+
+    urls_exist = dict()
+
+    for url, future in futures.items():
+        try:
+            urls_exist[url] = future.result()
+        except urllib3.exceptions.HTTPError:
+            urls_exist[url] = False
+
+    return urls_exist
+
+
+def parse_time_selected(time_selected: str) -> datetime:
+    """Parse a ``time_selected`` value in either of the show time formats into a ``datetime``."""
     try:
-        return requests.head(url=url).status_code == 200
-    except requests.RequestException:
-        return False
+        # show time selection option 2
+        return datetime.strptime(time_selected, TIME_SELECTED_FORMAT)
+    except ValueError:
+        # show time selection option 1
+        return datetime.strptime(time_selected, READABLE_TIME_FORMAT)
+
+
+def build_audio_url(normalized_show_name: str, time_selected: str) -> str:
+    """Build the archive audio URL for a normalized show name and ``TIME_SELECTED_FORMAT`` time."""
+    return (
+        'https://kzfr-media.s3.us-west-000.backblazeb2.com/audio/'
+        f'{normalized_show_name}/{normalized_show_name}_{time_selected}.mp3'
+    )
+
+
+def normalize_show_name(title: str) -> str:
+    """Normalize a show title ``title`` into the name used in its archive audio URLs."""
+    # this has to match the archive audio URLs exactly, so keep the regex's quirks as they are
+    return PUNCTUATION_PATTERN.sub('', title).replace('  ', ' ').replace(' ', '-').lower()
+
+
+def update_query_params(params: Dict[str, str]) -> None:
+    """Replace the page's query parameters with ``params``, but only if they actually changed."""
+    if st.query_params.to_dict() != params:
+        st.query_params.from_dict(params=params)
 
 
 def display_audio_stream(url: str, filesize: Optional[int] = None) -> None:
@@ -194,7 +460,7 @@ def display_stream_with_metadata(
         display_audio_stream(url=url, filesize=filesize)
 
 
-show_titles, archives_df = read_studio_creek_website_data()
+archive_data = read_studio_creek_website_data()
 
 
 SHOW_TIME_SELECTION_OPTIONS = [
@@ -203,7 +469,7 @@ SHOW_TIME_SELECTION_OPTIONS = [
 ]
 
 
-show_options = show_titles
+show_options = archive_data.show_titles
 
 if len(show_options) <= 1:
     st.error('No KZFR shows found in the current Studio Creek archive.')
@@ -222,8 +488,8 @@ if len(st.session_state) == 0:
 if not st.session_state.get('show_selected'):
     try:
         query_params_show_selected = query_params['show_selected']
-        show_selected_idx = show_options.index(query_params_show_selected)
-    except (IndexError, KeyError, ValueError):
+        show_selected_idx = archive_data.show_title_positions.get(query_params_show_selected)
+    except KeyError:
         show_selected_idx = None
 
 st.selectbox(
@@ -233,13 +499,12 @@ st.selectbox(
     key='show_selected',
 )
 
-st.query_params.clear()
+if not st.session_state.show_selected:
+    update_query_params(params={})
 
 if st.session_state.show_selected:
-    st.query_params.clear()
-
-    filtered_df = archives_df[archives_df['title'] == st.session_state.show_selected]
-    time_options = filtered_df['start_readable'].unique().tolist()
+    show_row_positions = archive_data.title_row_positions.get(st.session_state.show_selected, [])
+    time_options = archive_data.time_options_by_title.get(st.session_state.show_selected, [])
 
     if not st.session_state.get('show_time_selection'):
         try:
@@ -266,6 +531,7 @@ if st.session_state.show_selected:
 
     if st.session_state.show_time_selection == SHOW_TIME_SELECTION_OPTIONS[0]:
         if not time_options:
+            update_query_params(params={})
             st.error(
                 f'No "{st.session_state.show_selected}" show times found in the current Studio '
                 'Creek archive.'
@@ -280,7 +546,7 @@ if st.session_state.show_selected:
 
             if st.session_state.time_selected:
                 # weird note: this has to include what we already set above ¯\_(ツ)_/¯
-                st.query_params.from_dict(
+                update_query_params(
                     params={
                         'show_selected': st.session_state.show_selected,
                         'time_selected': st.session_state.time_selected,
@@ -289,37 +555,32 @@ if st.session_state.show_selected:
 
                 # select the first show with the matching time
                 try:
-                    show_series = (
-                        filtered_df[
-                            filtered_df['start'].dt.strftime('%Y-%m-%d_%H-%M-%S')
-                            == st.session_state.time_selected
+                    show_record = archive_data.archive_records[
+                        archive_data.row_positions[
+                            (st.session_state.show_selected, st.session_state.time_selected)
                         ]
-                        .iloc[0]
+                    ]
+                except KeyError:
+                    st.error(
+                        f'No show found at the date and time {st.session_state.time_selected}. '
+                        'Please try again with new options.'
                     )
-                except IndexError:
-                    try:
-                        show_series = (
-                            filtered_df[
-                                filtered_df['start_readable'] == st.session_state.time_selected
-                            ]
-                            .iloc[0]
-                        )
-                    except IndexError:
-                        st.error(
-                            f'No show found at the date and time {st.session_state.time_selected}. '
-                            'Please try again with new options.'
-                        )
-                        st.stop()
-
-                if check_if_url_exists(url=show_series.get('url')):
+                    st.stop()
+
+                try:
+                    show_url_exists = check_if_url_exists(url=show_record['url'])
+                except urllib3.exceptions.HTTPError:
+                    show_url_exists = False
+
+                if show_url_exists:
                     display_stream_with_metadata(
-                        title=show_series.get('title'),
+                        title=st.session_state.show_selected,
                         time_selected=st.session_state.time_selected,
-                        image_url=show_series.get('image_url'),
-                        summary=show_series.get('summary'),
-                        description=show_series.get('description'),
-                        url=show_series.get('url'),
-                        filesize=show_series.get('filesize'),
+                        image_url=show_record['image_url'],
+                        summary=show_record['summary'],
+                        description=show_record['description'],
+                        url=show_record['url'],
+                        filesize=show_record['filesize'],
                     )
                 else:
                     st.error(
@@ -329,79 +590,65 @@ if st.session_state.show_selected:
                     st.stop()
 
     elif st.session_state.show_time_selection == SHOW_TIME_SELECTION_OPTIONS[1]:
-        normalized_show_name = (
-            re.sub(r'[^\w\s]', '', st.session_state.show_selected)
-            .replace('  ', ' ')
-            .replace(' ', '-')
-            .lower()
-        )
+        normalized_show_name = normalize_show_name(title=st.session_state.show_selected)
 
         if not st.session_state.get('time_selected'):
             try:
                 query_params_time_selected = query_params['time_selected']
 
-                try:
-                    # show time selection option 2
-                    query_params_time_selected_datetime = datetime.strptime(
-                        query_params_time_selected,
-                        '%Y-%m-%d_%H-%M-%S',
-                    )
-                except ValueError:
-                    # show time selection option 1
-                    query_params_time_selected_datetime = datetime.strptime(
-                        query_params_time_selected,
-                        '%m/%d/%Y @ %I:%M %p',
-                    )
+                query_params_time_selected_datetime = parse_time_selected(
+                    time_selected=query_params_time_selected,
+                )
             except (IndexError, KeyError, ValueError):
                 query_params_time_selected_datetime = None
 
-        col_1, col_2 = st.columns(spec=2)
-
-        filtered_df = archives_df[archives_df['title'] == st.session_state.show_selected]
-
         image_url = None
         summary = None
         description = None
 
-        if len(filtered_df) > 0:
-            filtered_df_row = filtered_df.iloc[0]
+        if len(show_row_positions) > 0:
+            first_show_record = archive_data.archive_records[show_row_positions[0]]
 
-            image_url = filtered_df_row['image_url']
-            summary = filtered_df_row['summary']
-            description = filtered_df_row['description']
+            image_url = first_show_record['image_url']
+            summary = first_show_record['summary']
+            description = first_show_record['description']
 
         if st.first_time_running and 'query_params_time_selected' in locals():
             st.session_state.time_selected = (
-                query_params_time_selected_datetime.strftime('%Y-%m-%d_%H-%M-%S')
+                query_params_time_selected_datetime.strftime(TIME_SELECTED_FORMAT)
             )
         else:
-            if len(filtered_df) > 0:
-                try:
-                    first_found_show_time = filtered_df['start'].iloc[0]
-
-                    if 'query_params_time_selected_datetime' not in locals():
-                        query_params_time_selected_datetime = first_found_show_time
-                except IndexError:
-                    pass
-
-            with col_1:
-                show_date = st.date_input(
-                    label='What day did the show occur?',
-                    **(
-                        {'value': query_params_time_selected_datetime}
-                        if 'query_params_time_selected_datetime' in locals()
-                        else {}
-                    ),
-                )
-            with col_2:
-                show_time = st.time_input(
-                    label='What time (24-hour time in PST) did the show occur?',
-                    **(
-                        {'value': query_params_time_selected_datetime}
-                        if 'query_params_time_selected_datetime' in locals()
-                        else {}
-                    ),
-                )
+            if (
+                len(show_row_positions) > 0
+                and 'query_params_time_selected_datetime' not in locals()
+            ):
+                query_params_time_selected_datetime = first_show_record['start']
+
+            # batch the date and time edits into a single rerun on submit, rather than rerunning
+            # (and re-checking the audio URL) after every change to either input
+            with st.form(key='show_time_form', border=False):
+                col_1, col_2 = st.columns(spec=2)
+
+                with col_1:
+                    show_date = st.date_input(
+                        label='What day did the show occur?',
+                        **(
+                            {'value': query_params_time_selected_datetime}
+                            if 'query_params_time_selected_datetime' in locals()
+                            else {}
+                        ),
+                    )
+                with col_2:
+                    show_time = st.time_input(
+                        label='What time (24-hour time in PST) did the show occur?',
+                        **(
+                            {'value': query_params_time_selected_datetime}
+                            if 'query_params_time_selected_datetime' in locals()
+                            else {}
+                        ),
+                    )
+
+                st.form_submit_button(label='Find show')
 
             st.caption(
                 "Note that shows aired earlier than ``8/8/22`` MAY NOT appear in Studio Creek's "
@@ -409,66 +656,64 @@ if st.session_state.show_selected:
             )
 
             st.session_state.time_selected = (
-                f'{show_date.strftime("%Y-%m-%d")}_{show_time.strftime("%H-%M-%S")}'
+                datetime.combine(date=show_date, time=show_time).strftime(TIME_SELECTED_FORMAT)
             )
 
         # weird note: this has to include what we already set above ¯\_(ツ)_/¯
-        st.query_params.from_dict(
+        update_query_params(
             params={
                 'show_selected': st.session_state.show_selected,
                 'time_selected': st.session_state.time_selected,
             },
         )
 
-        # ugh what a stupid hack
-        philosophers_on_culture_and_whats_the_frequency_kenneth_time_swap_dict = {
-            '2023-11-09_17-00-00': '2023-11-16_17-00-00',
-            '2023-10-26_17-00-00': '2023-11-02_17-00-00',
-            '2023-10-12_17-00-00': '2023-10_19-17-00-00',
-            '2023-09-28_17-00-00': '2023-10_05-17-00-00',
-            '2023-09-14_17-00-00': '2023-09_21-17-00-00',
-            '2023-08-31_17-00-00': '2023-09_07-17-00-00',
-            '2023-08-17_17-00-00': '2023-08-24_17-00-00',
-            '2023-08-03_17-00-00': '2023-08-10_17-00-00',
-            '2023-07-20_17-00-00': '2023-07-27_17-00-00',
-        }
-        whats_the_frequency_kenneth_time_swap_and_philosophers_on_culture_dict = {
-            v: k
-            for k, v in (
-                philosophers_on_culture_and_whats_the_frequency_kenneth_time_swap_dict.items()
-            )
-        }
-        time_swap_dict = {
-            **philosophers_on_culture_and_whats_the_frequency_kenneth_time_swap_dict,
-            **whats_the_frequency_kenneth_time_swap_and_philosophers_on_culture_dict
-        }
-
-        if st.session_state.time_selected in time_swap_dict:
-            st.session_state.time_selected = time_swap_dict[st.session_state.time_selected]
+        if st.session_state.time_selected in TIME_SWAP_DICT:
+            st.session_state.time_selected = TIME_SWAP_DICT[st.session_state.time_selected]
             normalized_show_name = (
                 'whats-the-frequency-kenneth'
                 if normalized_show_name == 'philosophers-on-culture'
                 else 'philosophers-on-culture'
             )
 
-        url = (
-            'https://kzfr-media.s3.us-west-000.backblazeb2.com/audio/'
-            f'{normalized_show_name}/{normalized_show_name}_{st.session_state.time_selected}.mp3'
+        url = build_audio_url(
+            normalized_show_name=normalized_show_name,
+            time_selected=st.session_state.time_selected,
         )
 
-        time_selected_to_display = (
-            datetime.strptime(st.session_state.time_selected, '%Y-%m-%d_%H-%M-%S')
-            .strftime('%m/%d/%Y @ %I:%M %p')
+        time_selected_datetime = (
+            datetime.strptime(st.session_state.time_selected, TIME_SELECTED_FORMAT)
         )
+        time_selected_to_display = time_selected_datetime.strftime(READABLE_TIME_FORMAT)
+
+        filesize = archive_data.filesize_by_url.get(url)
+
+        # also check the archive branch's default show in the same batch, so switching over to
+        # searching the archive is instant
+        archive_urls = []
+
+        if time_options:
+            archive_url = archive_data.archive_records[
+                archive_data.row_positions[(st.session_state.show_selected, time_options[0])]
+            ]['url']
+
+            if archive_url:
+                archive_urls.append(archive_url)
+
+        # probe a few nearby show times in the same concurrent batch as the selected one, so any
+        # suggestions for a slightly-off show time cost no extra round-trip when it is missing
+        nearby_show_times = [
+            time_selected_datetime + offset for offset in NEARBY_SHOW_TIME_OFFSETS
+        ]
+        nearby_urls = [
+            build_audio_url(
+                normalized_show_name=normalized_show_name,
+                time_selected=nearby_show_time.strftime(TIME_SELECTED_FORMAT),
+            )
+            for nearby_show_time in nearby_show_times
+        ]
+        urls_exist = check_if_urls_exist(urls=[url, *nearby_urls, *archive_urls])
 
-        filesize_df = archives_df[archives_df['url'] == url]
-
-        filesize = None
-
-        if len(filesize_df) > 0:
-            filesize = filesize_df['filesize'].iloc[0]
-
-        if check_if_url_exists(url=url):
+        if urls_exist[url]:
             display_stream_with_metadata(
                 title=st.session_state.show_selected,
                 time_selected=time_selected_to_display,
@@ -483,6 +728,19 @@ if st.session_state.show_selected:
                 f'No show found at the date and time {st.session_state.time_selected}. '
                 'Please try again with new options.'
             )
+
+            nearby_show_times_found = [
+                nearby_show_time.strftime(READABLE_TIME_FORMAT)
+                for nearby_show_time, nearby_url in zip(nearby_show_times, nearby_urls)
+                if urls_exist[nearby_url]
+            ]
+
+            if nearby_show_times_found:
+                st.info(
+                    f'Did you mean one of these {st.session_state.show_selected} show times? '
+                    + ', '.join(nearby_show_times_found)
+                )
+
             st.stop()
 
 st.markdown(body='-----')